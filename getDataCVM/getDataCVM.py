@@ -14,22 +14,480 @@ Classes included:
     - DFP: For DFP data.
 """
 
-import requests
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
 import zipfile
-import pandas as pd
-from io import BytesIO
-from typing import Dict, Any, List, Literal
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import formatdate, parsedate_to_datetime
+from functools import cached_property, lru_cache
+from io import TextIOWrapper
+from pathlib import Path
+from queue import Queue
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile, TemporaryFile
+from threading import Lock, get_ident
+from urllib.parse import unquote
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+# pandas, requests, bs4 e pyarrow são importados apenas quando usados, para que
+# importar o pacote seja rápido; aqui ficam só para as anotações de tipo
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+    import requests
+
+try:
+    from platformdirs import user_cache_dir
+except ImportError:  # platformdirs é opcional; sem ele usa-se ~/.cache
+    user_cache_dir = None
+
+# Downloads simultâneos; também é o tamanho do pool de conexões da sessão
+_MAX_DOWNLOADS: int = 16
+
+# Validade, em segundos, da lista de datasets guardada em disco antes de revalidá-la
+_DATASET_CACHE_TTL: int = 24 * 60 * 60
+
+# Arquivos ZIP maiores que este limite são gravados em disco durante o download
+_SPOOL_MAX_SIZE: int = 64 * 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def _load_pyarrow() -> Tuple[Any, Any, Any]:
+    """
+    Imports pyarrow on first use, so that importing the package does not pay for it.
+
+    Returns:
+        Tuple[Any, Any, Any]: The pyarrow, pyarrow.csv and pyarrow.parquet modules, or three Nones if
+            pyarrow is not installed or is older than 14 (the version required by the "arrow" extra).
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        import pyarrow.parquet as pq
+    except ImportError:  # pyarrow é opcional; sem ele o leitor do pandas é usado
+        return None, None, None
+    # concat_tables(promote_options=...) só existe a partir do pyarrow 14
+    if int(pa.__version__.split(".")[0]) < 14:
+        return None, None, None
+    return pa, pacsv, pq
+
+
+@lru_cache(maxsize=None)
+def _html_parser() -> str:
+    """
+    Returns the parser used by BeautifulSoup: lxml when it is installed, html.parser otherwise.
+
+    Returns:
+        str: The name of the parser.
+    """
+    try:
+        import lxml  # noqa: F401
+    except ImportError:  # lxml é opcional; sem ele usa-se o parser puro Python
+        return "html.parser"
+    return "lxml"
+
+
+def _cache_dir() -> Path:
+    """
+    Returns the directory where downloaded files are cached, creating it if needed.
+
+    Uses platformdirs when available and falls back to $XDG_CACHE_HOME (or ~/.cache) otherwise.
+
+    Returns:
+        Path: The cache directory for the package.
+    """
+    if user_cache_dir is not None:
+        path: Path = Path(user_cache_dir("getDataCVM"))
+    else:
+        path = (
+            Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+            / "getDataCVM"
+        )
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _concat_frames(data_list: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenates the yearly DataFrames into a single DataFrame with a fresh RangeIndex.
+
+    Frames whose columns match the first frame's are given that same Index object, so pd.concat
+    does not need to align them. When every frame shares the same unique columns and holds only
+    string columns (object, or the str dtype of pandas >= 3), each column is concatenated on its own,
+    keeping its dtype, and the result is built without consolidating blocks, avoiding the extra copy
+    made by pd.concat. Any other case falls back to pd.concat.
+
+    Parameters:
+        data_list (List[pd.DataFrame]): The non-empty list of DataFrames to concatenate.
+
+    Returns:
+        pd.DataFrame: The concatenated DataFrame.
+    """
+    import pandas as pd
+    from pandas.api.types import is_string_dtype
+
+    columns: pd.Index = data_list[0].columns
+    # Anos com o mesmo cabeçalho passam a compartilhar o mesmo objeto Index, o que
+    # permite ao pd.concat pular o alinhamento de colunas
+    for df in data_list[1:]:
+        if df.columns is not columns and df.columns.equals(columns):
+            df.columns = columns
+    if columns.is_unique and all(
+        df.columns is columns and all(is_string_dtype(t) for t in df.dtypes)
+        for df in data_list
+    ):
+        return pd.DataFrame(
+            {
+                column: pd.concat([df[column] for df in data_list], ignore_index=True)
+                for column in columns
+            },
+            columns=columns,
+            copy=False,
+        )
+    return pd.concat(data_list, ignore_index=True)
+
+
+def _apply_dtype(df: pd.DataFrame, dtype: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Casts the given columns of a DataFrame read with every column as a string.
+
+    Empty cells become missing values before the cast, so a numeric column with blanks is converted
+    (to NaN) instead of failing. Columns not in the DataFrame are ignored. Values that cannot be
+    converted raise, whichever CSV reader was used.
+
+    Parameters:
+        df (pd.DataFrame): The DataFrame to convert.
+        dtype (Dict[str, Any]): Dtypes for specific columns.
+
+    Returns:
+        pd.DataFrame: The DataFrame with the converted columns.
+    """
+    columns: Dict[str, Any] = {
+        column: t for column, t in dtype.items() if column in df.columns
+    }
+    for column in columns:
+        df[column] = df[column].mask(df[column] == "")
+    return df.astype(columns)
+
+
+@lru_cache(maxsize=None)
+def _make_session() -> requests.Session:
+    """
+    Creates the HTTP session shared by every request made by the package, on first use.
+
+    The session keeps a pool of keep-alive connections, so downloads of several years reuse the
+    same TCP/TLS connections, and retries requests that fail to connect or that get a transient
+    gateway error from the server. Once the retries are exhausted the last response is returned, so
+    callers still see the error through raise_for_status.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session: requests.Session = requests.Session()
+    adapter: HTTPAdapter = HTTPAdapter(
+        pool_connections=_MAX_DOWNLOADS,
+        pool_maxsize=_MAX_DOWNLOADS,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _parse_dataset_page(page: str, data_type: str) -> Dict[str, str]:
+    """
+    Builds the dataset dictionary used by DataCVM.find_dataset from the HTML of the CVM dataset page.
+
+    Parameters:
+        page (str): The HTML of the CVM dataset page.
+        data_type (str): The dataset type identifier (e.g., "fca_cia_aberta", "fre_cia_aberta").
+
+    Returns:
+        Dict[str, str]: A dictionary where each key is a dataset identifier (str) and each value is a CSV filename template.
+    """
+    if "fca" in data_type:
+        delimiter: str = "("
+    elif "fre" in data_type:
+        delimiter = ":"
+    else:
+        delimiter = ":"  # valor padrão, se necessário
+
+    from bs4 import BeautifulSoup
+
+    html: BeautifulSoup = BeautifulSoup(page, _html_parser())
+    prefix: str = data_type.removesuffix("aberta")
+    data_type_prefix: str = data_type + "_"
+    dataset: Dict[str, str] = {}
+
+    # Um único seletor CSS substitui o find("strong") feito em cada <li>
+    for li in html.select("li:has(strong)"):
+        text: str = li.get_text(strip=True)
+        if not text.startswith(prefix):
+            continue
+        upper_limit: int = text.find(delimiter)
+        text = text[:upper_limit].replace("(anteriormente", "")
+        if data_type in text:
+            key: str = text.removeprefix(data_type_prefix)
+            value: str = f"{text}_" + "{year}.csv"
+        else:
+            key = text.removeprefix(prefix)
+            value = f"{data_type}_{key}_" + "{year}.csv"
+        dataset[key] = value
+
+    # Adiciona uma entrada padrão "original"
+    dataset["original"] = data_type + "_{year}.csv"
+    return dataset
+
+
+@lru_cache(maxsize=None)
+def _find_dataset_cached(
+    url_dataset: str, data_type: str, use_cache: bool = True
+) -> Dict[str, str]:
+    """
+    Scrapes the CVM dataset page and builds the dataset dictionary used by DataCVM.find_dataset.
+
+    Results are memoized per (url_dataset, data_type, use_cache), so the page is downloaded and parsed
+    at most once per process. Callers must not mutate the returned dictionary.
+
+    When use_cache is set, the result is also stored as JSON in the cache directory, together with the
+    page's ETag and Last-Modified headers. A file younger than _DATASET_CACHE_TTL is used as is; an
+    older one is revalidated with a conditional GET, so an unchanged page costs neither the body
+    transfer nor the HTML parse. The stored result is also used when the page cannot be reached.
+    If the cache directory cannot be read or written, the result is only memoized in memory.
+
+    Parameters:
+        url_dataset (str): The URL of the CVM dataset page.
+        data_type (str): The dataset type identifier (e.g., "fca_cia_aberta", "fre_cia_aberta").
+        use_cache (bool): Whether to use the JSON file in the cache directory.
+
+    Returns:
+        Dict[str, str]: A dictionary where each key is a dataset identifier (str) and each value is a CSV filename template.
+    """
+    import requests
+
+    cache_path: Optional[Path] = None
+    if use_cache:
+        key: str = hashlib.sha1(f"{url_dataset}|{data_type}".encode()).hexdigest()[:16]
+        try:
+            cache_path = _cache_dir() / f"datasets_{key}.json"
+        except OSError:
+            pass  # diretório de cache indisponível; a memoização em memória basta
+
+    if cache_path is None:
+        response: requests.Response = _make_session().get(url_dataset, timeout=10)
+        response.raise_for_status()  # não memoiza páginas de erro
+        return _parse_dataset_page(response.text, data_type)
+
+    cached: Optional[Dict[str, Any]] = None
+    if cache_path.exists():
+        try:
+            with open(cache_path, encoding="utf-8") as file:
+                cached = json.load(file)
+            age: float = time.time() - cache_path.stat().st_mtime
+        except (OSError, ValueError):
+            cached = None  # arquivo ilegível ou corrompido; baixa a página novamente
+        if cached is not None and age < _DATASET_CACHE_TTL:
+            return cached["dataset"]
+
+    headers: Dict[str, str] = {}
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    try:
+        response = _make_session().get(url_dataset, headers=headers, timeout=10)
+        response.raise_for_status()
+    except requests.exceptions.RequestException:
+        if cached is None:
+            raise
+        return cached["dataset"]  # sem conexão, usa a cópia local
+
+    if response.status_code == 304 and cached is not None:
+        try:
+            cache_path.touch()
+        except OSError:
+            pass  # a cópia continua válida; só será revalidada de novo na próxima vez
+        return cached["dataset"]
+
+    dataset: Dict[str, str] = _parse_dataset_page(response.text, data_type)
+    tmp_path: Optional[Path] = None
+    try:
+        # Um arquivo temporário único evita conflito entre threads que gravam ao mesmo tempo
+        with NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_path.parent, suffix=".tmp", delete=False
+        ) as file:
+            tmp_path = Path(file.name)
+            json.dump(
+                {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "dataset": dataset,
+                },
+                file,
+            )
+        tmp_path.replace(cache_path)
+    except OSError:
+        # O arquivo em disco é só uma otimização; sem ele, o resultado fica só em memória
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+    return dataset
+
+
+def _read_csv_arrow(file: IO[bytes], usecols: Optional[List[str]] = None) -> "pa.Table":
+    """
+    Reads a CVM CSV file (semicolon separated, ISO-8859-1 encoded) into an Arrow Table.
+
+    The header is read first so that every column can be typed as a string, as done by the pandas
+    reader; the rest of the file is parsed by pyarrow's multithreaded reader. The file is consumed
+    only once, so it may be a non-seekable stream.
+
+    Parameters:
+        file (IO[bytes]): The binary file object positioned at the start of the CSV.
+        usecols (Optional[List[str]]): The columns to read; every column is read when None. Columns
+            missing from the file are ignored; if none of them is in the file, the table is empty
+            (no rows and no columns), as with the pandas reader.
+
+    Returns:
+        pa.Table: The parsed data, with every column as a string.
+    """
+    pa, pacsv, _ = _load_pyarrow()
+    columns: List[str] = file.readline().rstrip(b"\r\n").decode("ISO-8859-1").split(";")
+    include_columns: Optional[List[str]] = (
+        None if usecols is None else [column for column in usecols if column in columns]
+    )
+    # Para o pyarrow, uma lista vazia significa "todas as colunas"
+    if include_columns == []:
+        return pa.table({})
+    return pacsv.read_csv(
+        file,
+        read_options=pacsv.ReadOptions(
+            encoding="ISO-8859-1", use_threads=True, column_names=columns
+        ),
+        # Campos de texto livre (ex.: descrições do FRE/IPE) podem ter quebras de linha
+        parse_options=pacsv.ParseOptions(delimiter=";", newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            column_types={column: pa.string() for column in columns},
+            include_columns=include_columns,
+        ),
+    )
+
+
+def _decode_year(
+    zip_data: IO[bytes],
+    csv_filename: str,
+    parquet_path: Optional[Path] = None,
+    zip_mtime: Optional[float] = None,
+    usecols: Optional[List[str]] = None,
+) -> Union["pa.Table", pd.DataFrame]:
+    """
+    Decompresses a yearly ZIP file and parses the requested CSV file, with every column as a string.
+
+    When pyarrow is available the CSV is read into an Arrow Table, so that all years can be
+    concatenated before a single conversion to pandas; otherwise it is read into a DataFrame. If
+    parquet_path is given, the table is also written there (atomically, with zip_mtime as its
+    modification time) to be reused by later calls.
+
+    Parameters:
+        zip_data (IO[bytes]): A seekable file holding the ZIP content.
+        csv_filename (str): The name of the CSV file inside the ZIP.
+        parquet_path (Optional[Path]): Where to store the parsed table as Parquet, if anywhere.
+        zip_mtime (Optional[float]): The modification time of the cached ZIP file.
+        usecols (Optional[List[str]]): The columns to read; every column is read when None. Columns
+            missing from the file are ignored.
+
+    Returns:
+        Union[pa.Table, pd.DataFrame]: The parsed data.
+    """
+    _, pacsv, pq = _load_pyarrow()
+    with zipfile.ZipFile(zip_data) as zip_file:
+        if pacsv is None:
+            import pandas as pd
+
+            with zip_file.open(csv_filename) as file:
+                return pd.read_csv(
+                    file,
+                    sep=";",
+                    encoding="ISO-8859-1",
+                    dtype=str,
+                    usecols=(
+                        None if usecols is None else lambda column: column in usecols
+                    ),
+                    engine="c",
+                    low_memory=False,
+                    na_filter=False,
+                )
+
+        with zip_file.open(csv_filename) as file:
+            table: pa.Table = _read_csv_arrow(file, usecols)
+
+    if parquet_path is not None:
+        tmp_path: Path = parquet_path.with_name(
+            f"{parquet_path.name}.{os.getpid()}.{get_ident()}.tmp"
+        )
+        try:
+            parquet_path.parent.mkdir(exist_ok=True)
+            pq.write_table(table, tmp_path, compression="zstd")
+            if zip_mtime is not None:
+                os.utime(tmp_path, (zip_mtime, zip_mtime))
+            tmp_path.replace(parquet_path)
+        except OSError:
+            # O Parquet é só uma otimização; sem permissão de escrita, segue sem ele
+            tmp_path.unlink(missing_ok=True)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    return table
 
 
 class DataCVM:
+    # Mantém os ZIPs baixados em disco para evitar novos downloads nas próximas chamadas
+    use_cache: bool = True
+
+    @property
+    def _session(self) -> requests.Session:
+        """
+        The session shared by every instance, which reuses the keep-alive connections.
+
+        Returns:
+            requests.Session: The shared session.
+        """
+        return _make_session()
+
     def find_dataset(self, data_type: str) -> Dict[str, str]:
         """
         Retrieves a dictionary of dataset keys and corresponding CSV filename templates from the CVM dataset page.
 
         The method performs an HTTP GET request to self.url_dataset, parses the HTML to find list items
         containing dataset information, and builds a dictionary mapping a dataset key to a CSV filename template.
-        An additional entry with key "original" is added.
+        An additional entry with key "original" is added. The scrape is memoized, so further calls with the
+        same arguments (from any instance) do not hit the network again, and with self.use_cache set the
+        result is also kept on disk across sessions.
 
         Parameters:
             data_type (str): The dataset type identifier (e.g., "fca_cia_aberta", "fre_cia_aberta").
@@ -37,34 +495,263 @@ class DataCVM:
         Returns:
             Dict[str, str]: A dictionary where each key is a dataset identifier (str) and each value is a CSV filename template.
         """
-        if "fca" in data_type:
-            delimiter: str = "("
-        elif "fre" in data_type:
-            delimiter = ":"
-        else:
-            delimiter = ":"  # valor padrão, se necessário
-
-        response: requests.Response = requests.get(self.url_dataset)
-        html: BeautifulSoup = BeautifulSoup(response.text, "html.parser")
-        li_strong: List[Any] = [li for li in html.find_all("li") if li.find("strong")]
-        dataset: Dict[str, str] = {}
-
-        for li in li_strong:
-            text: str = li.get_text(strip=True)
-            if text.startswith(data_type.removesuffix("aberta")):
-                upper_limit: int = text.find(delimiter)
-                text = text[:upper_limit].replace("(anteriormente", "")
-                if data_type in text:
-                    key: str = text.removeprefix(data_type + "_")
-                    value: str = f"{text}_" + "{year}.csv"
-                else:
-                    key = text.removeprefix(data_type.removesuffix("aberta"))
-                    value = f"{data_type}_{key}_" + "{year}.csv"
-                dataset[key] = value
-
-        # Adiciona uma entrada padrão "original"
-        dataset["original"] = data_type + "_{year}.csv"
-        return dataset
+        return dict(_find_dataset_cached(self.url_dataset, data_type, self.use_cache))
+
+    def _list_files(self, base_url: str) -> Optional[Set[str]]:
+        """
+        Lists the files published in a CVM data directory.
+
+        The CVM serves each DADOS/ directory as an HTML index page; the file names are taken from its
+        links. This lets download_data skip years that do not exist instead of requesting each of them.
+
+        Parameters:
+            base_url (str): The URL of the directory.
+
+        Returns:
+            Optional[Set[str]]: The names of the files in the directory, or None if the listing is not available.
+        """
+        import requests
+        from bs4 import BeautifulSoup
+
+        try:
+            response: requests.Response = self._session.get(base_url, timeout=10)
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            return None  # sem a listagem, todos os anos são tentados
+        html: BeautifulSoup = BeautifulSoup(response.text, _html_parser())
+        files: Set[str] = {
+            unquote(a["href"].rsplit("/", 1)[-1]) for a in html.find_all("a", href=True)
+        }
+        # Uma página sem nenhum ZIP não é a listagem esperada
+        return files if any(name.endswith(".zip") for name in files) else None
+
+    def _download_year(
+        self,
+        year: int,
+        base_url: str,
+        zip_template: str,
+    ) -> Optional[IO[bytes]]:
+        """
+        Downloads the raw ZIP file for a single year.
+
+        When self.use_cache is set, the ZIP file is kept in the cache directory and reused on later calls
+        as long as the server does not report a newer version. Otherwise the response is streamed into a
+        spooled temporary file, which stays in memory for small files and spills to disk once it grows
+        beyond _SPOOL_MAX_SIZE (on Python < 3.11, a plain temporary file on disk).
+
+        Errors are reported and swallowed so that a missing year does not abort the whole range. If
+        the cache directory cannot be created or written, the year is downloaded without it.
+
+        Parameters:
+            year (int): The year to download.
+            base_url (str): The base URL from which the ZIP files are downloaded.
+            zip_template (str): A string template for the ZIP filename.
+
+        Returns:
+            Optional[IO[bytes]]: A seekable file holding the ZIP content, or None if it could not be downloaded.
+        """
+        import requests
+
+        zip_filename: str = zip_template.format(year=year)
+        url: str = base_url + zip_filename
+
+        zip_data: Optional[IO[bytes]] = None
+        try:
+            if self.use_cache:
+                try:
+                    return self._download_cached(year, url, _cache_dir() / zip_filename)
+                except OSError as e:
+                    # Cache indisponível (ex.: HOME somente leitura); baixa sem ele
+                    print(f"Cache unavailable for year {year} ({e}), skipping it.")
+
+            # Antes do Python 3.11 o SpooledTemporaryFile não tem seekable(), exigido
+            # pelo zipfile
+            zip_data = (
+                SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+                if sys.version_info >= (3, 11)
+                else TemporaryFile()
+            )
+            with self._session.get(url, timeout=10, stream=True) as r:
+                r.raise_for_status()
+                # Remove um eventual Content-Encoding (gzip) do servidor ao copiar
+                r.raw.decode_content = True
+                shutil.copyfileobj(r.raw, zip_data)
+            zip_data.seek(0)
+            return zip_data
+        except requests.exceptions.RequestException as e:
+            print(f"Error downloading data for year {year}: {e}")
+        except Exception as e:
+            print(f"Unexpected error for year {year}: {e}")
+        if zip_data is not None:
+            zip_data.close()
+        return None
+
+    def _download_cached(
+        self,
+        year: int,
+        url: str,
+        cache_path: Path,
+    ) -> Optional[IO[bytes]]:
+        """
+        Returns the ZIP file for a single year from the disk cache, downloading it first if needed.
+
+        The download is a conditional GET (If-Modified-Since, from the cached file's modification
+        time), so a single request either confirms the cached file with a 304 or returns the new
+        content. The cached file is also reused when the request or the download of a newer version
+        fails. New downloads are written to a temporary file and atomically renamed into place. Errors
+        reading or writing the cache itself (OSError) are raised to the caller.
+
+        Parameters:
+            year (int): The year to download.
+            url (str): The URL of the ZIP file.
+            cache_path (Path): The location of the cached ZIP file.
+
+        Returns:
+            Optional[IO[bytes]]: The cached ZIP file opened for reading, or None if it could not be downloaded.
+        """
+        import requests
+
+        try:
+            headers: Dict[str, str] = {}
+            if cache_path.exists():
+                # O mtime do arquivo em cache é o Last-Modified informado pelo servidor
+                headers["If-Modified-Since"] = formatdate(
+                    cache_path.stat().st_mtime, usegmt=True
+                )
+            r: Optional[requests.Response] = None
+            try:
+                r = self._session.get(url, headers=headers, timeout=10, stream=True)
+                if r.status_code != 304:
+                    r.raise_for_status()
+            except requests.exceptions.RequestException:
+                if r is not None:
+                    r.close()  # devolve a conexão ao pool
+                if not headers:
+                    raise
+                r = None  # servidor indisponível, usa a cópia local
+            if r is None or r.status_code == 304:
+                if r is not None:
+                    r.close()
+                print(f"Using cached data for year {year}.")
+                return open(cache_path, "rb")
+
+            with r:
+                r.raw.decode_content = True
+                last_modified: Optional[str] = r.headers.get("Last-Modified")
+                tmp: IO[bytes] = NamedTemporaryFile(
+                    dir=cache_path.parent, suffix=".tmp", delete=False
+                )
+                tmp_path: Path = Path(tmp.name)
+                try:
+                    with tmp:
+                        shutil.copyfileobj(r.raw, tmp)
+                    if last_modified is not None:
+                        timestamp: float = parsedate_to_datetime(
+                            last_modified
+                        ).timestamp()
+                        os.utime(tmp_path, (timestamp, timestamp))
+                    tmp_path.replace(cache_path)
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+            return open(cache_path, "rb")
+
+        except requests.exceptions.RequestException as e:
+            print(f"Error downloading data for year {year}: {e}")
+        except OSError:
+            # Falha ao ler ou gravar o cache; _download_year baixa o arquivo sem ele
+            raise
+        except Exception as e:
+            print(f"Unexpected error for year {year}: {e}")
+        # Um download interrompido não altera a cópia local, que só é substituída
+        # por um arquivo completo
+        try:
+            if cache_path.exists():
+                print(f"Using cached data for year {year}.")
+                return open(cache_path, "rb")
+        except OSError:
+            pass
+        return None
+
+    def _read_year(
+        self,
+        year: int,
+        zip_data: IO[bytes],
+        zip_template: str,
+        csv_template: str,
+        usecols: Optional[List[str]] = None,
+    ) -> Optional[Union["pa.Table", pd.DataFrame]]:
+        """
+        Reads the CSV file for a single year from the downloaded ZIP file.
+
+        The decompression and parsing are done by _decode_year. When self.use_cache is set and
+        pyarrow is available, a Parquet file produced by a previous call is read instead (only the
+        requested columns, if usecols is given), as long as the cached ZIP has not been replaced in the
+        meantime. The Parquet file is only written when every column is read, and is skipped when the
+        cache directory is not usable. The ZIP file is closed once it has been read.
+
+        Errors are reported and swallowed so that a corrupt year does not abort the whole range.
+
+        Parameters:
+            year (int): The year being processed.
+            zip_data (IO[bytes]): A seekable file holding the ZIP content.
+            zip_template (str): A string template for the ZIP filename.
+            csv_template (str): A string template for the CSV filename inside the ZIP.
+            usecols (Optional[List[str]]): The columns to read; every column is read when None.
+
+        Returns:
+            Optional[Union[pa.Table, pd.DataFrame]]: The data for the year, or None if it could not be read.
+        """
+        pa, _, pq = _load_pyarrow()
+        try:
+            csv_filename: str = csv_template.format(year=year)
+            parquet_path: Optional[Path] = None
+            zip_mtime: Optional[float] = None
+            with zip_data:
+                if self.use_cache and pa is not None:
+                    # O Parquet herda o mtime do ZIP de origem, o que permite detectar ZIPs atualizados
+                    zip_mtime = os.fstat(zip_data.fileno()).st_mtime
+                    try:
+                        parquet_path = (
+                            _cache_dir()
+                            / Path(zip_template.format(year=year)).stem
+                            / Path(csv_filename).with_suffix(".parquet").name
+                        )
+                    except OSError:
+                        pass  # sem diretório de cache, lê o CSV sem usar o Parquet
+                    if (
+                        parquet_path is not None
+                        and parquet_path.exists()
+                        and parquet_path.stat().st_mtime == zip_mtime
+                    ):
+                        columns: Optional[List[str]] = None
+                        if usecols is not None:
+                            names: List[str] = pq.read_schema(parquet_path).names
+                            columns = [column for column in usecols if column in names]
+                        # Mesmo resultado dos leitores de CSV quando nenhuma coluna existe
+                        table: pa.Table = (
+                            pa.table({})
+                            if columns == []
+                            else pq.read_table(parquet_path, columns=columns)
+                        )
+                        print(f"Finished reading cached data for year {year}.")
+                        return table
+
+                data: Union["pa.Table", pd.DataFrame] = _decode_year(
+                    zip_data,
+                    csv_filename,
+                    None if usecols is not None else parquet_path,
+                    zip_mtime,
+                    usecols,
+                )
+            print(f"Finished reading data for year {year}.")
+            return data
+
+        except zipfile.BadZipFile:
+            print(f"Error unzipping file for year {year}.")
+        except Exception as e:
+            print(f"Unexpected error for year {year}: {e}")
+        return None
 
     def download_data(
         self,
@@ -73,13 +760,21 @@ class DataCVM:
         base_url: str,
         zip_template: str,
         csv_template: str,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
     ) -> pd.DataFrame:
         """
         Downloads and concatenates data from CVM for a range of years using ZIP and CSV filename templates.
 
-        For each year in the range [start, end), the method constructs the ZIP filename using the zip_template,
-        downloads the ZIP file from base_url, extracts the CSV file specified by csv_template,
-        reads its content into a pandas DataFrame, and appends it to a list. Finally, all DataFrames are concatenated.
+        Years whose ZIP file is not listed in the base_url directory are skipped (and reported) up front.
+        For each remaining year in the range [start, end), the method constructs the ZIP filename using the zip_template,
+        downloads the ZIP file from base_url, extracts the CSV file specified by csv_template and
+        reads its content. Years are downloaded concurrently through a thread pool
+        sharing the connection-pooled class session, and each downloaded ZIP is handed through a bounded queue
+        to a pool of parse threads, so parsing overlaps with the remaining downloads. Decompression and
+        pyarrow's multithreaded CSV reader release the GIL.
+        Finally, all years are concatenated in year order; with pyarrow installed they are kept as Arrow
+        Tables until this point and converted to a pandas DataFrame only once.
 
         Parameters:
             start (int): The starting year (inclusive).
@@ -87,49 +782,113 @@ class DataCVM:
             base_url (str): The base URL from which the ZIP files are downloaded.
             zip_template (str): A string template for the ZIP filename (e.g., "fca_cia_aberta_{year}.zip").
             csv_template (str): A string template for the CSV filename inside the ZIP (e.g., "fca_cia_aberta_geral_{year}.csv").
+            usecols (Optional[List[str]]): The columns to read; every column is read when None. Columns
+                missing from a year's file are ignored, and a year holding none of them adds no rows.
+            dtype (Optional[Dict[str, Any]]): Dtypes for specific columns; the other columns are read as strings.
+                Empty cells become missing values before the conversion; values that cannot be converted
+                raise an error.
 
         Returns:
             pd.DataFrame: A DataFrame containing the concatenated data from all processed years.
         """
-        data_list: List[pd.DataFrame] = []
-        for year in range(start, end):
-            zip_filename: str = zip_template.format(year=year)
-            url: str = base_url + zip_filename
+        import pandas as pd
 
-            try:
-                r: requests.Response = requests.get(url, timeout=10)
-                r.raise_for_status()
+        pa, _, _ = _load_pyarrow()
+        years: List[int] = list(range(start, end))
+        available: Optional[Set[str]] = self._list_files(base_url)
+        if available is not None:
+            missing: List[int] = [
+                year
+                for year in years
+                if zip_template.format(year=year) not in available
+            ]
+            if missing:
+                print(f"No data available for years {missing}.")
+                years = [year for year in years if year not in missing]
+        if not years:
+            return pd.DataFrame()
 
-                with zipfile.ZipFile(BytesIO(r.content)) as zip_file:
-                    csv_filename: str = csv_template.format(year=year)
-                    with zip_file.open(csv_filename) as file:
-                        lines: List[bytes] = file.readlines()
-                        decoded_lines: List[str] = [
-                            line.strip().decode("ISO-8859-1") for line in lines
-                        ]
-                        split_lines: List[List[str]] = [
-                            line.split(";") for line in decoded_lines
-                        ]
-                        df: pd.DataFrame = pd.DataFrame(
-                            data=split_lines[1:], columns=split_lines[0]
-                        )
-                        data_list.append(df)
-                        print(f"Finished reading data for year {year}.")
+        max_workers: int = min(_MAX_DOWNLOADS, len(years))
+
+        # Pipeline: os downloads alimentam uma fila limitada (que controla o pico de memória)
+        # enquanto outros workers descompactam e leem os ZIPs já baixados.
+        zip_queue: "Queue[Optional[Tuple[int, IO[bytes]]]]" = Queue(maxsize=4)
+        results: Dict[int, Union["pa.Table", pd.DataFrame]] = {}
+        results_lock: Lock = Lock()
+        # Uma thread por núcleo descompacta e lê os ZIPs de anos diferentes em paralelo
+        parse_workers: int = min(os.cpu_count() or 1, len(years))
+
+        def download_worker(year: int) -> None:
+            zip_data: Optional[IO[bytes]] = self._download_year(
+                year, base_url, zip_template
+            )
+            if zip_data is not None:
+                zip_queue.put((year, zip_data))
+
+        def parse_worker() -> None:
+            while True:
+                item: Optional[Tuple[int, IO[bytes]]] = zip_queue.get()
+                if item is None:
+                    break
+                year, zip_data = item
+                data: Optional[Union["pa.Table", pd.DataFrame]] = self._read_year(
+                    year,
+                    zip_data,
+                    zip_template,
+                    csv_template,
+                    usecols,
+                )
+                if data is not None:
+                    with results_lock:
+                        results[year] = data
 
-            except requests.exceptions.RequestException as e:
-                print(f"Error downloading data for year {year}: {e}")
-            except zipfile.BadZipFile:
-                print(f"Error unzipping file for year {year}.")
-            except Exception as e:
-                print(f"Unexpected error for year {year}: {e}")
+        with ThreadPoolExecutor(max_workers=parse_workers) as parsers:
+            parse_futures = [parsers.submit(parse_worker) for _ in range(parse_workers)]
+            try:
+                with ThreadPoolExecutor(max_workers=max_workers) as downloaders:
+                    download_futures = [
+                        downloaders.submit(download_worker, year) for year in years
+                    ]
+                    try:
+                        for future in as_completed(download_futures):
+                            future.result()
+                    except BaseException:
+                        # Em caso de erro (ou Ctrl-C), não inicia os downloads pendentes
+                        for future in download_futures:
+                            future.cancel()
+                        raise
+            finally:
+                # Os parsers precisam do sinal de parada mesmo se algum download falhar,
+                # senão ficam bloqueados na fila e a saída do bloco nunca termina
+                for _ in range(parse_workers):
+                    zip_queue.put(None)
+            for future in parse_futures:
+                future.result()
 
-        return pd.concat(data_list, ignore_index=True) if data_list else pd.DataFrame()
+        # Mantém a ordem cronológica, independente da ordem de conclusão
+        data_list: List[Union["pa.Table", pd.DataFrame]] = [
+            results[year] for year in sorted(results)
+        ]
+        if not data_list:
+            return pd.DataFrame()
+        if pa is not None:
+            # As tabelas Arrow são concatenadas sem copiar os buffers (colunas ausentes
+            # em algum ano viram nulos) e convertidas para pandas uma única vez.
+            df: pd.DataFrame = pa.concat_tables(
+                data_list, promote_options="default"
+            ).to_pandas(types_mapper=pd.ArrowDtype)
+        else:
+            df = _concat_frames(data_list)
+        # A conversão de tipos é feita uma única vez, igual para os dois leitores
+        return _apply_dtype(df, dtype) if dtype else df
 
     def get_data(
         self,
         dataset: str,
         start: int,
         end: int,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
     ) -> pd.DataFrame:
         """
         Generic method to retrieve data for a specified dataset over a range of years.
@@ -143,6 +902,8 @@ class DataCVM:
             dataset (str): The key of the dataset to download.
             start (int): The starting year (inclusive).
             end (int): The ending year (exclusive).
+            usecols (Optional[List[str]]): The columns to read; every column is read when None.
+            dtype (Optional[Dict[str, Any]]): Dtypes for specific columns; the other columns are read as strings.
 
         Returns:
             pd.DataFrame: A DataFrame containing the concatenated data.
@@ -159,7 +920,7 @@ class DataCVM:
             )
         csv_template: str = self.datasets[dataset]
         return self.download_data(
-            start, end, self.base_url, self.zip_template, csv_template
+            start, end, self.base_url, self.zip_template, csv_template, usecols, dtype
         )
 
 
@@ -181,10 +942,24 @@ class RegData(DataCVM):
         Returns:
             pd.DataFrame: A DataFrame containing the registration data.
         """
-        r: requests.Response = requests.get(self.url)
-        lines: List[str] = r.text.split("\n")
-        split_lines: List[List[str]] = [line.split(";") for line in lines]
-        df: pd.DataFrame = pd.DataFrame(data=split_lines[1:-1], columns=split_lines[0])
+        import pandas as pd
+
+        _, pacsv, _ = _load_pyarrow()
+        with self._session.get(self.url, timeout=10, stream=True) as r:
+            r.raise_for_status()
+            # Os leitores precisam do stream aberto até o fim da leitura
+            r.raw.decode_content = True
+            r.raw.auto_close = False
+            if pacsv is not None:
+                # Colunas de texto em Arrow, como no resultado de download_data
+                return _read_csv_arrow(r.raw).to_pandas(types_mapper=pd.ArrowDtype)
+            df: pd.DataFrame = pd.read_csv(
+                TextIOWrapper(r.raw, encoding="ISO-8859-1", newline=""),
+                sep=";",
+                dtype=str,
+                engine="c",
+                na_filter=False,
+            )
         return df
 
 
@@ -196,7 +971,16 @@ class FCA(DataCVM):
         self.url_dataset: str = "https://dados.cvm.gov.br/dataset/cia_aberta-doc-fca"
         self.base_url: str = "https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/FCA/DADOS/"
         self.zip_template: str = "fca_cia_aberta_{year}.zip"
-        self.datasets: Dict[str, str] = self.find_dataset("fca_cia_aberta")
+
+    @cached_property
+    def datasets(self) -> Dict[str, str]:
+        """
+        Scrapes the FCA dataset page on first access, so constructing the class does not hit the network.
+
+        Returns:
+            Dict[str, str]: A dictionary mapping dataset keys to CSV filename templates.
+        """
+        return self.find_dataset("fca_cia_aberta")
 
     def get_data(
         self,
@@ -214,6 +998,8 @@ class FCA(DataCVM):
         ],
         start: int,
         end: int,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
     ) -> pd.DataFrame:
         """
         Retrieves FCA data for the specified dataset and year range.
@@ -222,11 +1008,13 @@ class FCA(DataCVM):
             dataset (Literal[...]): A string containing one of the allowed dataset keys.
             start (int): The starting year (inclusive) – minimum year 2010.
             end (int): The ending year (exclusive).
+            usecols (Optional[List[str]]): The columns to read; every column is read when None.
+            dtype (Optional[Dict[str, Any]]): Dtypes for specific columns; the other columns are read as strings.
 
         Returns:
             pd.DataFrame: A DataFrame containing the concatenated FCA data.
         """
-        return super().get_data(dataset, start, end)
+        return super().get_data(dataset, start, end, usecols, dtype)
 
 
 class FRE(DataCVM):
@@ -237,7 +1025,16 @@ class FRE(DataCVM):
         self.url_dataset: str = "https://dados.cvm.gov.br/dataset/cia_aberta-doc-fre"
         self.base_url: str = "https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/FRE/DADOS/"
         self.zip_template: str = "fre_cia_aberta_{year}.zip"
-        self.datasets: Dict[str, str] = self.find_dataset("fre_cia_aberta")
+
+    @cached_property
+    def datasets(self) -> Dict[str, str]:
+        """
+        Scrapes the FRE dataset page on first access, so constructing the class does not hit the network.
+
+        Returns:
+            Dict[str, str]: A dictionary mapping dataset keys to CSV filename templates.
+        """
+        return self.find_dataset("fre_cia_aberta")
 
     def get_data(
         self,
@@ -304,6 +1101,8 @@ class FRE(DataCVM):
         ],
         start: int,
         end: int,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
     ) -> pd.DataFrame:
         """
         Retrieves FRE data for the specified dataset and year range.
@@ -312,11 +1111,13 @@ class FRE(DataCVM):
             dataset (Literal[...]): A string containing one of the allowed dataset keys.
             start (int): The starting year (inclusive) – minimum year 2010.
             end (int): The ending year (exclusive).
+            usecols (Optional[List[str]]): The columns to read; every column is read when None.
+            dtype (Optional[Dict[str, Any]]): Dtypes for specific columns; the other columns are read as strings.
 
         Returns:
             pd.DataFrame: A DataFrame containing the concatenated FRE data.
         """
-        return super().get_data(dataset, start, end)
+        return super().get_data(dataset, start, end, usecols, dtype)
 
 
 class IPE(DataCVM):
@@ -332,6 +1133,8 @@ class IPE(DataCVM):
         self,
         start: int,
         end: int,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
     ) -> pd.DataFrame:
         """
         Retrieves IPE data (unstructured company filings) for the specified year range.
@@ -339,11 +1142,13 @@ class IPE(DataCVM):
         Parameters:
             start (int): The starting year (inclusive) – minimum year 2003.
             end (int): The ending year (exclusive).
+            usecols (Optional[List[str]]): The columns to read; every column is read when None.
+            dtype (Optional[Dict[str, Any]]): Dtypes for specific columns; the other columns are read as strings.
 
         Returns:
             pd.DataFrame: A DataFrame containing the concatenated IPE data.
         """
-        return super().get_data("original", start, end)
+        return super().get_data("original", start, end, usecols, dtype)
 
 
 class ITR(DataCVM):
@@ -398,6 +1203,8 @@ class ITR(DataCVM):
         ],
         start: int,
         end: int,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
     ) -> pd.DataFrame:
         """
         Retrieves ITR data for the specified dataset and year range.
@@ -406,11 +1213,13 @@ class ITR(DataCVM):
             dataset (Literal[...]): A string containing one of the allowed dataset keys.
             start (int): The starting year (inclusive) – minimum year 2011.
             end (int): The ending year (exclusive).
+            usecols (Optional[List[str]]): The columns to read; every column is read when None.
+            dtype (Optional[Dict[str, Any]]): Dtypes for specific columns; the other columns are read as strings.
 
         Returns:
             pd.DataFrame: A DataFrame containing the concatenated ITR data.
         """
-        return super().get_data(dataset, start, end)
+        return super().get_data(dataset, start, end, usecols, dtype)
 
 
 class VLMO(DataCVM):
@@ -430,6 +1239,8 @@ class VLMO(DataCVM):
         dataset: Literal["original", "consolidado"],
         start: int,
         end: int,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
     ) -> pd.DataFrame:
         """
         Retrieves VLMO data for the specified dataset and year range.
@@ -438,11 +1249,13 @@ class VLMO(DataCVM):
             dataset (Literal["original", "consolidado"]): A string containing one of the allowed dataset keys.
             start (int): The starting year (inclusive) – minimum year 2020.
             end (int): The ending year (exclusive).
+            usecols (Optional[List[str]]): The columns to read; every column is read when None.
+            dtype (Optional[Dict[str, Any]]): Dtypes for specific columns; the other columns are read as strings.
 
         Returns:
             pd.DataFrame: A DataFrame containing the concatenated VLMO data.
         """
-        return super().get_data(dataset, start, end)
+        return super().get_data(dataset, start, end, usecols, dtype)
 
 
 class ICBGC(DataCVM):
@@ -462,6 +1275,8 @@ class ICBGC(DataCVM):
         dataset: Literal["original", "praticas"],
         start: int,
         end: int,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
     ) -> pd.DataFrame:
         """
         Retrieves ICBGC data for the specified dataset and year range.
@@ -470,11 +1285,13 @@ class ICBGC(DataCVM):
             dataset (Literal["original", "praticas"]): A string containing one of the allowed dataset keys.
             start (int): The starting year (inclusive) – minimum year 2020.
             end (int): The ending year (exclusive).
+            usecols (Optional[List[str]]): The columns to read; every column is read when None.
+            dtype (Optional[Dict[str, Any]]): Dtypes for specific columns; the other columns are read as strings.
 
         Returns:
             pd.DataFrame: A DataFrame containing the concatenated ICBGC data.
         """
-        return super().get_data(dataset, start, end)
+        return super().get_data(dataset, start, end, usecols, dtype)
 
 
 class DFP(DataCVM):
@@ -529,6 +1346,8 @@ class DFP(DataCVM):
         ],
         start: int,
         end: int,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
     ) -> pd.DataFrame:
         """
         Retrieves DFP data for the specified dataset and year range.
@@ -537,8 +1356,10 @@ class DFP(DataCVM):
             dataset (Literal[...]): A string containing one of the allowed dataset keys.
             start (int): The starting year (inclusive) – minimum year 2010.
             end (int): The ending year (exclusive).
+            usecols (Optional[List[str]]): The columns to read; every column is read when None.
+            dtype (Optional[Dict[str, Any]]): Dtypes for specific columns; the other columns are read as strings.
 
         Returns:
             pd.DataFrame: A DataFrame containing the concatenated DFP data.
         """
-        return super().get_data(dataset, start, end)
+        return super().get_data(dataset, start, end, usecols, dtype)
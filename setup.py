@@ -11,6 +11,7 @@ setup(
     platforms="any",
     packages=["getDataCVM"],
     install_requires=["requests", "pandas", "beautifulsoup4"],
+    extras_require={"arrow": ["pyarrow>=14"], "lxml": ["lxml"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",